@@ -0,0 +1,100 @@
+# numba kernels for summary.outlier_summary(use_numba=True)
+# functions/_numba_kernels.py
+# imported on first use only: importing numba takes longer than most summaries
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, nogil=True)
+def _select_kth(buf, left, right, k):
+    """
+    Quickselect: reorders buf[left:right + 1] in place so that buf[k] holds its sorted value,
+    with smaller-or-equal values before it and larger-or-equal after.
+    """
+    while right > left:
+        a, b, c = buf[left], buf[(left + right) // 2], buf[right]
+        pivot = max(min(a, b), min(max(a, b), c))  # median of three
+
+        i, j = left, right
+        while i <= j:
+            while buf[i] < pivot:
+                i += 1
+            while buf[j] > pivot:
+                j -= 1
+            if i <= j:
+                buf[i], buf[j] = buf[j], buf[i]
+                i += 1
+                j -= 1
+
+        if k <= j:
+            right = j
+        elif k >= i:
+            left = i
+        else:
+            return
+
+@njit(cache=True, nogil=True)
+def _rank_pair(buf, start, n, k):
+    """
+    Returns the sorted values at ranks k and k + 1 of buf[:n], given that buf[:start] already
+    holds the `start` smallest values. The second one is the minimum of what lies above rank k.
+    """
+    _select_kth(buf, start, n - 1, k)
+    if k + 1 >= n:
+        return buf[k], buf[k]
+
+    above = buf[k + 1]
+    for i in range(k + 2, n):
+        if buf[i] < above:
+            above = buf[i]
+    return buf[k], above
+
+@njit(cache=True, nogil=True)
+def _lerp(a, b, t):
+    """Two-sided linear interpolation, as in np.quantile."""
+    if t >= 0.5:
+        return b - (b - a) * (1.0 - t)
+    return a + (b - a) * t
+
+@njit(parallel=True, cache=True, nogil=True)
+def count_outliers_iqr(arr, multiplier):
+    """
+    Counts IQR outliers per column of a 2-D float64 array in one fused pass, columns in parallel.
+
+    Each column is compacted (NaN dropped) into a local buffer, Q1 is selected over the whole
+    buffer and Q3 only over the part above Q1, and the outliers are counted in the same buffer.
+    Quantiles use linear interpolation over the non-NaN values, matching `Series.quantile`.
+    """
+    n_rows, n_cols = arr.shape
+    counts = np.zeros(n_cols, dtype=np.int64)
+
+    for j in prange(n_cols):
+        buf = np.empty(n_rows, dtype=np.float64)
+        n = 0
+        for i in range(n_rows):
+            v = arr[i, j]
+            if not np.isnan(v):
+                buf[n] = v
+                n += 1
+        if n == 0:
+            continue
+
+        pos1 = 0.25 * (n - 1)
+        pos3 = 0.75 * (n - 1)
+        lo1 = int(pos1)
+        lo3 = int(pos3)
+        a1, b1 = _rank_pair(buf, 0, n, lo1)
+        a3, b3 = _rank_pair(buf, lo1 + 1 if lo3 > lo1 else lo1, n, lo3)
+        q1 = _lerp(a1, b1, pos1 - lo1)
+        q3 = _lerp(a3, b3, pos3 - lo3)
+
+        iqr = q3 - q1
+        lower = q1 - multiplier * iqr
+        upper = q3 + multiplier * iqr
+        c = 0
+        for i in range(n):
+            if buf[i] < lower or buf[i] > upper:
+                c += 1
+        counts[j] = c
+
+    return counts
@@ -4,19 +4,565 @@
 3. head(), info(), .dtypes, describe(), missing values, unique values, outliers (via quantiles)
 '''
 import pandas as pd
+import numpy as np
+import html
+import importlib.util
+import io
 import logging
-from functions.validators import validate_dataframe_or_series, validate_dataframe, validate_positive_integer
-from IPython.display import display
-
-# setting up printing options to read output conveniently
-pd.set_option('display.max_columns', None)
-pd.set_option('display.max_rows', None)
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+from functions.validators import validate, validate_dataframe_or_series, validate_dataframe, validate_positive_integer
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional, the outlier mask falls back to plain NumPy without it
+    ne = None
+
+if TYPE_CHECKING:
+    import polars as pl
 
 # Logger setup
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
+# below this the numexpr thread pool costs more than the two temporary boolean arrays it saves
+_NUMEXPR_MIN_CELLS = 100_000
+# below this describe() runs its column chunks in the calling thread
+_PARALLEL_MIN_CELLS = 1_000_000
+
+# row labels of df.describe() for numeric columns
+_DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+def _check_engine(engine: str) -> None:
+    """
+    Validates the `engine` argument of the summary helpers.
+
+    Raises:
+        ValueError: If engine is not 'pandas' or 'polars'.
+        ImportError: If engine is 'polars' but polars is not installed.
+    """
+    if engine not in ('pandas', 'polars'):
+        logger.error("Invalid engine: %s", engine)
+        raise ValueError("engine must be either 'pandas' or 'polars'")
+
+    # polars is optional and only imported by the polars helpers; importing it here would add ~150 ms
+    # to every import of this module
+    if engine == 'polars' and importlib.util.find_spec("polars") is None:
+        logger.error("engine='polars' requested but polars is not installed")
+        raise ImportError("engine='polars' requires the optional polars package")
+
+
+def _to_polars(df: pd.DataFrame) -> "pl.LazyFrame":
+    """
+    Converts a DataFrame to a polars LazyFrame with positional column names '0', '1', ...
+
+    Polars needs unique string names, so results are mapped back to `df.columns` by position.
+    NaN becomes null on conversion, matching pandas' missing-value semantics.
+    """
+    import polars as pl
+    return pl.from_pandas(df.set_axis([str(i) for i in range(df.shape[1])], axis=1)).lazy()
+
+
+def _polars_describe(lf: "pl.LazyFrame", columns: pd.Index) -> pd.DataFrame:
+    """
+    Polars version of `numeric_df.describe()` on its `_to_polars` LazyFrame; all statistics of all columns
+    run in one parallel query. `columns` labels the result.
+    """
+    import polars as pl
+
+    stats = {
+        "count": lambda c: c.count(),
+        "mean": lambda c: c.mean(),
+        "std": lambda c: c.std(),
+        "min": lambda c: c.min(),
+        "25%": lambda c: c.quantile(0.25, interpolation='linear'),
+        "50%": lambda c: c.quantile(0.5, interpolation='linear'),
+        "75%": lambda c: c.quantile(0.75, interpolation='linear'),
+        "max": lambda c: c.max(),
+    }
+    names = [str(i) for i in range(len(columns))]
+    exprs = [func(pl.col(name)).cast(pl.Float64).alias(f"{stat}_{name}") for stat, func in stats.items() for name in names]
+    row = lf.select(exprs).collect().row(0)
+
+    values = np.array(row, dtype=np.float64).reshape(len(stats), len(names))
+    return pd.DataFrame(values, index=list(stats), columns=columns)
+
+
+def _polars_null_counts(lf: "pl.LazyFrame") -> np.ndarray:
+    """
+    Polars version of `df.isna().sum()` on a `_to_polars` LazyFrame (NaN already converted to null).
+    """
+    import polars as pl
+    return np.array(lf.select(pl.all().null_count()).collect().row(0), dtype=np.int64)
+
+
+def _polars_outlier_counts(lf: "pl.LazyFrame", multiplier: float) -> np.ndarray:
+    """
+    Polars version of the IQR outlier count on a `_to_polars` LazyFrame; every column's quantiles and
+    comparison run in one query.
+    """
+    import polars as pl
+
+    exprs = []
+    for i in range(len(lf.collect_schema())):
+        col = pl.col(str(i))
+        q1 = col.quantile(0.25, interpolation='linear')
+        q3 = col.quantile(0.75, interpolation='linear')
+        iqr = q3 - q1
+        exprs.append(((col < q1 - multiplier * iqr) | (col > q3 + multiplier * iqr)).sum().alias(str(i)))
+
+    return np.array(lf.select(exprs).collect().row(0), dtype=np.int64)
+
+
+def _column_quantiles(arr: np.ndarray, q: list[float], has_nan: np.ndarray | None = None) -> np.ndarray:
+    """
+    Returns the `q` quantiles of every column of a 2-D float64 array, ignoring NaN, shaped (len(q), n_cols).
+
+    Columns without NaN go through a single `np.quantile` call for all of them at once; only columns
+    containing NaN are handled one by one, each partitioned once around all requested ranks (and their
+    interpolation neighbours). Linear interpolation matches `Series.quantile`; all-NaN columns get NaN.
+    `has_nan` (per column) can be passed in by callers that already scanned for NaN.
+    """
+    q = np.asarray(q, dtype=np.float64)
+    result = np.full((len(q), arr.shape[1]), np.nan)
+    if arr.shape[0] == 0:
+        return result
+
+    # quantiles run along the last axis of the transpose: to_numpy() hands out column-major arrays,
+    # and np.quantile over axis=0 would partition strided data (about 2x slower)
+    if has_nan is None:
+        has_nan = np.isnan(arr).any(axis=0)
+    if not has_nan.any():
+        result[:] = np.quantile(arr.T, q, axis=1)
+        return result
+    if not has_nan.all():
+        # the boolean selection is already a private copy, so np.quantile may partition it in place
+        result[:, ~has_nan] = np.quantile(arr[:, ~has_nan].T, q, axis=1, overwrite_input=True)
+
+    for j in np.flatnonzero(has_nan):
+        col = arr[:, j]
+        # dropping NaN copies the column, which is then partitioned in place
+        col = col[~np.isnan(col)]
+        n = col.size
+        if n == 0:
+            continue
+
+        pos = q * (n - 1)
+        lo = pos.astype(np.intp)
+        hi = np.minimum(lo + 1, n - 1)
+        col.partition(np.unique(np.concatenate([lo, hi])))
+
+        # same two-sided lerp as np.quantile, so results are bit-identical to Series.quantile
+        a, b, t = col[lo], col[hi], pos - lo
+        result[:, j] = np.where(t >= 0.5, b - (b - a) * (1 - t), a + (b - a) * t)
+
+    return result
+
+
+def _describe_block(arr: np.ndarray) -> np.ndarray:
+    """
+    Returns the `describe()` statistics (rows of `_DESCRIBE_INDEX`) of every column of a 2-D float64 array.
+
+    Mean and std follow the arithmetic of pandas' nanops (NaN zero-filled, then summed). The NaN mask is
+    built once and shared by all statistics, including the quantiles; blocks without NaN skip the
+    masking, and the squared deviations are computed in place. Min and max stay separate reductions:
+    reading them off the quantile selection (q=0/1) would interpolate infinities into NaN.
+    """
+    n_rows = arr.shape[0]
+    mask = np.isnan(arr)
+    count = n_rows - np.count_nonzero(mask, axis=0)
+    has_nan = count < n_rows
+    any_nan = has_nan.any()
+
+    mean = (np.where(mask, 0.0, arr) if any_nan else arr).sum(axis=0) / count
+    sqr = np.subtract(mean, arr)
+    np.square(sqr, out=sqr)
+    if any_nan:
+        sqr[mask] = 0.0
+    # pandas gives NaN rather than 0 when there are fewer than two values
+    std = np.where(count > 1, np.sqrt(sqr.sum(axis=0) / (count - 1)), np.nan)
+
+    q25, q50, q75 = _column_quantiles(arr, [0.25, 0.5, 0.75], has_nan=has_nan)
+
+    # fmin/fmax skip NaN and only return it for all-NaN columns
+    return np.vstack([
+        count, mean, std,
+        np.fmin.reduce(arr, axis=0),
+        q25, q50, q75,
+        np.fmax.reduce(arr, axis=0),
+    ])
+
+
+def _parallel_describe(numeric_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    NumPy version of `numeric_df.describe()` that spreads column chunks over a thread pool.
+
+    The NumPy reductions release the GIL, so wide frames scale with the number of cores.
+    """
+    arr = _to_float_array(numeric_df)
+    n_workers = min(os.cpu_count() or 1, arr.shape[1])
+    if arr.size < _PARALLEL_MIN_CELLS:
+        n_workers = 1
+
+    # contiguous column ranges, so every worker gets a view instead of a copy
+    bounds = np.linspace(0, arr.shape[1], n_workers + 1).astype(int)
+    chunks = [arr[:, start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    with warnings.catch_warnings():
+        # all-NaN columns and single values give NaN statistics, as in pandas
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        if n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                blocks = list(pool.map(_describe_block, chunks))
+        else:
+            blocks = [_describe_block(arr)]
+
+    return pd.DataFrame(np.hstack(blocks), index=_DESCRIBE_INDEX, columns=numeric_df.columns)
+
+
+def _numpy_outlier_counts(arr: np.ndarray, multiplier: float) -> np.ndarray:
+    """
+    Counts IQR outliers per column of a 2-D float64 array.
+    """
+    q1, q3 = _column_quantiles(arr, [0.25, 0.75])
+    iqr = q3 - q1
+    lower = q1 - multiplier * iqr
+    upper = q3 + multiplier * iqr
+
+    if ne is not None and arr.size >= _NUMEXPR_MIN_CELLS and arr.dtype == np.float64 \
+            and (arr.flags['C_CONTIGUOUS'] or arr.flags['F_CONTIGUOUS']):
+        # one blocked, multi-threaded pass instead of two full-size comparison temporaries
+        mask = ne.evaluate("(arr < lower) | (arr > upper)")
+    else:
+        mask = (arr < lower) | (arr > upper)
+
+    return np.count_nonzero(mask, axis=0)
+
+
+def _histogram_outlier_count(col: np.ndarray, multiplier: float) -> int:
+    """
+    Counts IQR outliers of a 1-D 8/16-bit integer array from its value histogram.
+
+    One `np.bincount` pass replaces the partition: the quartiles are read off the cumulative counts
+    (with the same interpolation as `np.quantile`) and the outliers are summed over the bins outside
+    the bounds, so no per-element mask is built.
+    """
+    n = col.size
+    if n == 0:
+        return 0
+
+    offset = np.iinfo(col.dtype).min
+    hist = np.bincount(col.astype(np.intp) - offset)
+    cum = np.cumsum(hist)
+
+    # value at each sorted rank: the first bin whose cumulative count exceeds it
+    pos = np.array([0.25, 0.75]) * (n - 1)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    a = (np.searchsorted(cum, lo, side='right') + offset).astype(np.float64)
+    b = (np.searchsorted(cum, hi, side='right') + offset).astype(np.float64)
+    t = pos - lo
+    q1, q3 = np.where(t >= 0.5, b - (b - a) * (1 - t), a + (b - a) * t)
+
+    iqr = q3 - q1
+    values = np.arange(hist.size, dtype=np.float64) + offset
+    outside = (values < q1 - multiplier * iqr) | (values > q3 + multiplier * iqr)
+
+    return int(hist[outside].sum())
+
+
+def _count_duplicates(df: pd.DataFrame) -> int:
+    """
+    Counts duplicated rows exactly as `df.duplicated().sum()`, running `duplicated()` only on candidate rows.
+
+    Rows are hashed (one 64-bit hash per row) over the columns whose hashes agree with `duplicated()`'s
+    notion of equality: numeric, bool and datetime-like NumPy columns (floats normalised so that -0.0/0.0
+    and all NaN payloads hash alike) and categoricals. Two duplicated rows are equal on every column, so
+    their hashes match and a row with a unique hash cannot be a duplicate. Hash collisions and the columns
+    left out of the hash (object, extension arrays) only add candidates, which `duplicated()` settles.
+    """
+    if df.shape[1] == 0:
+        return 0
+
+    hashed = {}
+    for i, (dtype, (_, col)) in enumerate(zip(df.dtypes, df.items())):
+        if isinstance(dtype, pd.CategoricalDtype) or (isinstance(dtype, np.dtype) and dtype.kind in 'iubmM'):
+            hashed[i] = col.to_numpy() if isinstance(dtype, np.dtype) else col.array
+        elif isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            values = col.to_numpy() + 0.0
+            hashed[i] = np.where(np.isnan(values), np.nan, values)
+
+    if not hashed:
+        return int(df.duplicated().sum())
+
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(hashed), index=False).to_numpy()
+
+    # candidates: rows whose hash occurs more than once, found by sorting rather than a hash table
+    order = np.argsort(hashes)
+    sorted_hashes = hashes[order]
+    repeated = sorted_hashes[1:] == sorted_hashes[:-1]
+    in_group = np.zeros(len(hashes), dtype=bool)
+    in_group[1:] |= repeated
+    in_group[:-1] |= repeated
+    candidates = np.zeros(len(hashes), dtype=bool)
+    candidates[order] = in_group
+
+    if not candidates.any():
+        return 0
+
+    return int(df[candidates].duplicated().sum())
+
+
+def _null_counts(df: pd.DataFrame) -> pd.Series:
+    """
+    Counts missing values per column, as `df.isna().sum()` does, one storage block at a time.
+
+    `df.isna()` builds a boolean frame as large as `df`; walking the BlockManager's blocks (columns of one
+    dtype stored together) keeps at most one block's mask alive, and integer/bool blocks, which cannot
+    hold missing values, are not scanned at all.
+    """
+    counts = np.zeros(df.shape[1], dtype=np.int64)
+
+    for block in df._mgr.blocks:
+        values = block.values
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind in 'iub':
+                continue
+            # 2-D blocks are stored as (columns, rows)
+            nulls = np.isnan(values) if values.dtype.kind in 'fc' else pd.isna(values)
+        else:
+            # extension arrays (nullable, Arrow, categorical, tz-aware, ...), usually one column per block
+            nulls = np.asarray(values.isna())
+
+        counts[block.mgr_locs.as_array] = np.count_nonzero(nulls, axis=-1) if nulls.ndim == 2 else np.count_nonzero(nulls)
+
+    return pd.Series(counts, index=df.columns)
+
+
+def _to_float_array(numeric_df: pd.DataFrame) -> np.ndarray:
+    """
+    Returns the numeric columns as one 2-D float64 array with NaN for every missing value.
+
+    `na_value=np.nan` covers nullable dtypes, but NaT in timedelta columns converts to a huge negative
+    integer first, so those positions are set to NaN explicitly.
+    """
+    arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # a timedelta column always forces a converted copy, so writing into `arr` never touches numeric_df
+    for j, dtype in enumerate(numeric_df.dtypes):
+        if dtype.kind == 'm':
+            arr[numeric_df.iloc[:, j].isna().to_numpy(), j] = np.nan
+
+    return arr
+
+
+def _split_by_kind(df: pd.DataFrame, dtypes: pd.Series | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Splits a DataFrame into its numeric and its object/categorical columns with one pass over the dtypes.
 
+    Same selection as `select_dtypes(include='number')` and `select_dtypes(include=['object', 'category'])`,
+    but the dtypes are walked once for both, and positional slicing keeps duplicate column names intact.
+    """
+    numeric_positions, cat_positions = _kind_positions(df.dtypes if dtypes is None else dtypes)
+    return df.iloc[:, numeric_positions], df.iloc[:, cat_positions]
+
+
+def _kind_positions(dtypes: pd.Series) -> tuple[list[int], list[int]]:
+    """
+    Returns the positions of the numeric and of the object/categorical columns, as split by `_split_by_kind`.
+    """
+    numeric_positions = []
+    cat_positions = []
+
+    for i, dtype in enumerate(dtypes):
+        if (pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)) or dtype.kind == 'm':
+            numeric_positions.append(i)
+        elif dtype == object or isinstance(dtype, pd.CategoricalDtype):
+            cat_positions.append(i)
+
+    return numeric_positions, cat_positions
+
+
+@dataclass
+class _SummaryContext:
+    """
+    Per-frame values shared by the summary functions, each computed on first use and then reused.
+
+    `SummaryReport` builds one context and hands it to every section (as the keyword-only `ctx` argument
+    of the summary functions), so the dtypes are walked, the nulls counted and the columns split once
+    for the whole report.
+    """
+    df: pd.DataFrame
+    engine: str = 'pandas'
+
+    @cached_property
+    def dtypes(self) -> pd.Series:
+        return self.df.dtypes
+
+    @cached_property
+    def null_counts(self) -> pd.Series:
+        if self.engine != 'polars':
+            return _null_counts(self.df)
+
+        # polars counts the numeric columns on the LazyFrame shared with describe and the outliers;
+        # object and other columns are not converted just to count their nulls
+        is_numeric = np.zeros(self.df.shape[1], dtype=bool)
+        is_numeric[self._positions_by_kind[0]] = True
+        counts = np.zeros(self.df.shape[1], dtype=np.int64)
+        if is_numeric.any():
+            counts[is_numeric] = _polars_null_counts(self.polars_numeric)
+        if not is_numeric.all():
+            counts[~is_numeric] = _null_counts(self.df.iloc[:, np.flatnonzero(~is_numeric)]).to_numpy()
+        return pd.Series(counts, index=self.df.columns)
+
+    @cached_property
+    def nunique(self) -> np.ndarray:
+        # filled straight into a pre-allocated array, no per-column result Series is built or aligned
+        return np.fromiter((col.nunique() for _, col in self.df.items()), dtype=np.int64, count=self.df.shape[1])
+
+    @cached_property
+    def _positions_by_kind(self) -> tuple[list[int], list[int]]:
+        return _kind_positions(self.dtypes)
+
+    @cached_property
+    def _columns_by_kind(self) -> tuple[pd.DataFrame, pd.DataFrame]:
+        numeric_positions, cat_positions = self._positions_by_kind
+        return self.df.iloc[:, numeric_positions], self.df.iloc[:, cat_positions]
+
+    @property
+    def numeric_df(self) -> pd.DataFrame:
+        return self._columns_by_kind[0]
+
+    @property
+    def cat_df(self) -> pd.DataFrame:
+        return self._columns_by_kind[1]
+
+    @cached_property
+    def polars_numeric(self) -> "pl.LazyFrame":
+        # converted once and shared by the polars describe, outlier and null counts
+        return _to_polars(self.numeric_df)
+
+    @cached_property
+    def duplicated_rows(self) -> int:
+        return _count_duplicates(self.df)
+
+
+def _bounded_nunique(col: pd.Series, max_unique: int) -> int:
+    """
+    Returns `col.nunique()`, but stops counting once it exceeds `max_unique` and returns `max_unique + 1`.
+
+    Categoricals count the categories present in their codes. Other columns are hashed in chunks
+    (starting small and doubling, so high-cardinality columns exit after a few thousand rows and
+    low-cardinality ones still go through C in large pieces), each chunk's distinct non-null values
+    being merged into one set.
+    """
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        codes = col.cat.codes.to_numpy()
+        used = np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(col.cat.categories)))
+        return min(used, max_unique + 1)
+
+    # plain ndarray for NumPy dtypes (zero-copy), the extension array otherwise
+    values = col.to_numpy() if isinstance(col.dtype, np.dtype) else col.array
+    seen = set()
+    start, chunk = 0, 8192
+    while start < len(values):
+        uniques = pd.unique(values[start:start + chunk])
+        seen.update(uniques[~pd.isna(uniques)])
+        if len(seen) > max_unique:
+            return max_unique + 1
+        start += chunk
+        chunk = min(chunk * 2, 1 << 20)
+
+    return len(seen)
+
+
+def _top_k_indices(counts: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the positions of the `k` largest non-zero counts, largest first, ties in position order.
+
+    One `np.partition` finds the k-th largest count; only the counts above it and the first of those
+    equal to it are then sorted, so the cost is O(n + k log k) instead of a full sort.
+    """
+    k = min(k, len(counts))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+    above = np.flatnonzero(counts > kth)
+    tied = np.flatnonzero(counts == kth)[:k - len(above)]
+    idx = np.concatenate([above, tied])
+    idx = idx[np.argsort(-counts[idx], kind="stable")]
+
+    return idx[counts[idx] > 0]
+
+
+def _top_categories(col: pd.Series, top_n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the `top_n` most frequent observed categories of a categorical Series and their counts.
+
+    Counts come straight from the integer codes via `np.bincount`, so no Python objects are boxed.
+    """
+    categories = col.cat.categories.to_numpy()
+    codes = col.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+
+    idx = _top_k_indices(counts, top_n)
+    return categories[idx], counts[idx]
+
+
+def _display(obj) -> None:
+    """
+    Shows `obj` with `IPython.display.display`, imported on first use.
+
+    Importing IPython pulls in traitlets, jedi etc. (tens of milliseconds), which scripts that only
+    compute summaries should not pay for; after the first call the import is a module-cache lookup.
+    """
+    from IPython.display import display
+    display(obj)
+
+
+@contextmanager
+def summary_display_context(max_rows: int | None = None, max_columns: int | None = None):
+    """
+    Temporarily sets pandas' display limits for the enclosed block only.
+
+    With the defaults every row and column is shown, which is what this module used to set globally at
+    import time. Scoping it keeps the user's own `display(df)` calls elsewhere in the session bounded.
+
+    Args:
+        max_rows (int, optional): Value for 'display.max_rows'. None shows all rows. Defaults to None.
+        max_columns (int, optional): Value for 'display.max_columns'. None shows all columns. Defaults to None.
+
+    Example:
+        with summary_display_context():
+            display(missing_summary(df))
+    """
+    with pd.option_context('display.max_rows', max_rows, 'display.max_columns', max_columns):
+        yield
+
+
+def _top_objects(col: pd.Series, top_n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the `top_n` most frequent non-missing values of an object Series and their counts.
+
+    The values are factorized once (codes in first-seen order, missing values as -1), counted with
+    `np.bincount` and only the top `top_n` are selected, instead of sorting every distinct value like
+    `value_counts`. Ties keep their first-seen order.
+    """
+    codes, uniques = pd.factorize(col.to_numpy())
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    idx = _top_k_indices(counts, top_n)
+    return np.asarray(uniques, dtype=object)[idx], counts[idx]
+
+
+@validate(df=validate_dataframe_or_series, n=validate_positive_integer)
 def head_info(df: pd.DataFrame | pd.Series, n: int = 5) -> None:
     """
     Displays the first 5 rows (by default, else specified) and metadata of a DataFrame or Series.
@@ -26,61 +572,61 @@ def head_info(df: pd.DataFrame | pd.Series, n: int = 5) -> None:
         n (int, optional): Number of rows to display. Must be non-negative and integer. Defaults to 5.
 
     Raises:
-        TypeError: If `df` is not a pandas DataFrame or Series.
-        ValueError: If `n` is negative and non integer.
+        TypeError: If `df` is not a pandas DataFrame or Series, or `n` is not an integer.
+        ValueError: If `n` is smaller than 1.
 
     Returns:
         None
     """
-    # validation for either a df or a series
-    validate_dataframe_or_series(df)
-
-    # validation for positive integer
-    validate_positive_integer(n)
-    
     # since series doesn't have method info(), this is a manual alternative to dataframe's info method
     if isinstance(df, pd.Series):
-        display(df.head(n))
+        with summary_display_context():
+            _display(df.head(n))
         print(f"Type: {df.dtype}")
-        print(f"Missing values number: {df.isnull().sum()}")
+        print(f"Missing values number: {int(pd.isna(df.to_numpy()).sum())}")
         print(f'The shape is: {df.shape[0]}')
         return
 
-    display(df.head(n))
+    # the caller chose `n`, so all of those rows (and every column) are shown
+    with summary_display_context():
+        _display(df.head(n))
     df.info()
 
 
+@validate(df=validate_dataframe_or_series, n=validate_positive_integer)
 def head(df: pd.DataFrame | pd.Series, n: int = 5) -> pd.DataFrame | pd.Series:
     """
     Returns the first `n` rows of a DataFrame or Series.
+
+    The rows are a positional slice, which is already zero-copy for both backends: NumPy blocks are
+    sliced as views and pyarrow-backed columns (`dtype_backend='pyarrow'`) slice their ChunkedArray
+    without copying buffers. Going through `pa.Table` instead would only add a conversion round trip.
     
     Args:
         df (pd.DataFrame or pd.Series): The object to inspect.
         n (int, optional): Number of rows to return. Must be non-negative and integer. Defaults to 5.
 
     Raises:
-        TypeError: If `df` is not a pandas DataFrame or Series.
-        ValueError: If `n` is negative and non integer.
+        TypeError: If `df` is not a pandas DataFrame or Series, or `n` is not an integer.
+        ValueError: If `n` is smaller than 1.
 
     Returns:
         pd.DataFrame or pd.Series: The top `n` rows.
     """
-    
-    # validation for either a df or a series
-    validate_dataframe_or_series(df)
-
-    # validation for positive integer
-    validate_positive_integer(n)
 
     return df.head(n)
 
 
-def info(df: pd.DataFrame) -> None:
+def info(df: pd.DataFrame, memory_usage: bool | str | None = None, buf=None) -> None:
     """
     Prints metadata of a DataFrame.
 
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
+        memory_usage (bool or str, optional): Passed to `df.info`. None uses pandas' shallow estimate,
+            False skips it, and 'deep' introspects object columns (O(rows) per object column). Defaults to None.
+        buf (writable buffer, optional): Where to write the output, e.g. an `io.StringIO` to keep the text
+            for reuse instead of re-running `info`. Defaults to stdout.
 
     Raises:
         TypeError: If `df` is not a pandas DataFrame.
@@ -91,7 +637,7 @@ def info(df: pd.DataFrame) -> None:
     # validation for a df
     validate_dataframe(df)
 
-    df.info()
+    df.info(memory_usage=memory_usage, buf=buf)
 
 
 def sample_rows(df: pd.DataFrame, n: int = 3, random_state: int | None = None) -> pd.DataFrame:
@@ -106,8 +652,8 @@ def sample_rows(df: pd.DataFrame, n: int = 3, random_state: int | None = None) -
         random_state (int, optional): Seed for reproducibility. Defaults to 42.
 
     Raises:
-        TypeError: If input is not a DataFrame.
-        ValueError: If `n` is not a positive integer.
+        TypeError: If input is not a DataFrame, or `n` is not an integer.
+        ValueError: If `n` is smaller than 1.
 
     Returns:
         pd.DataFrame: Sampled rows from the DataFrame.
@@ -119,42 +665,46 @@ def sample_rows(df: pd.DataFrame, n: int = 3, random_state: int | None = None) -
     return df.sample(n=n, random_state=random_state)
 
 
+@validate(df=validate_dataframe_or_series, n=validate_positive_integer)
 def tail(df: pd.DataFrame | pd.Series, n: int = 5) -> pd.DataFrame | pd.Series:
     """
     Returns the last `n` rows of a DataFrame or Series.
 
+    Like `head`, this is a zero-copy positional slice for both NumPy- and pyarrow-backed frames.
+
     Args:
         df (pd.DataFrame or pd.Series): The object to inspect.
         n (int, optional): Number of rows to return from the bottom. Must be non-negative and integer. Defaults to 5.
 
     Raises:
-        TypeError: If `df` is not a pandas DataFrame or Series.
-        ValueError: If `n` is negative and non-integer.
+        TypeError: If `df` is not a pandas DataFrame or Series, or `n` is not an integer.
+        ValueError: If `n` is smaller than 1.
 
     Returns:
         pd.DataFrame or pd.Series: The bottom `n` rows.
     """
-    
-    # validation for either a df or a series
-    validate_dataframe_or_series(df)
-
-    # validation for positive integer
-    validate_positive_integer(n)
 
     return df.tail(n)
 
 
-def describe(df: pd.DataFrame, mode: str = 'numerical') -> pd.DataFrame:
+def describe(df: pd.DataFrame, mode: str = 'numerical', engine: str = 'pandas',
+             *, ctx: _SummaryContext | None = None) -> pd.DataFrame:
     """
     Returns descriptive statistics for a DataFrame.
 
     Args:
         df (pd.DataFrame): The DataFrame to describe.
         mode (str, optional): Either 'numerical' or 'full'. Defaults to 'numerical'.
+        engine (str, optional): 'pandas' or 'polars'. The polars engine covers the numeric columns in
+            'numerical' mode; 'full' mode and frames without numeric columns or with datetime/timedelta
+            columns always use pandas. Defaults to 'pandas'.
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`. Built when None.
 
     Raises:
         TypeError: If df is not a DataFrame.
-        ValueError: If mode is not 'numerical' or 'full'.
+        ValueError: If mode is not 'numerical' or 'full', or engine is unknown.
+        ImportError: If engine is 'polars' and polars is not installed.
 
     Returns:
         pd.DataFrame: Summary statistics.
@@ -166,73 +716,163 @@ def describe(df: pd.DataFrame, mode: str = 'numerical') -> pd.DataFrame:
         logger.error("Invalid mode: %s", mode)
         raise ValueError("mode must be either 'numerical' or 'full'")
 
+    _check_engine(engine)
+    if ctx is None:
+        ctx = _SummaryContext(df, engine)
+
+    # datetime and timedelta columns are described by pandas (with its own formatting), so the fast
+    # paths only take frames whose described columns are all plain numbers
+    if mode == 'numerical' and len(df) > 0 and not any(dtype.kind in 'mM' for dtype in ctx.dtypes):
+        numeric_df = ctx.numeric_df
+        if numeric_df.shape[1] > 0:
+            if engine == 'polars':
+                return _polars_describe(ctx.polars_numeric, numeric_df.columns)
+            # nullable/Arrow columns keep pandas' masked result dtypes
+            # (float32 is also left to pandas, which keeps its precision)
+            if all(isinstance(dtype, np.dtype) and (dtype.kind in 'iu' or dtype == np.float64)
+                   for dtype in numeric_df.dtypes):
+                return _parallel_describe(numeric_df)
+
     return df.describe() if mode == 'numerical' else df.describe(include='all')
 
 
-def columns_overview(df: pd.DataFrame) -> pd.DataFrame:
+def columns_overview(df: pd.DataFrame, max_unique: int | None = 1000,
+                     *, ctx: _SummaryContext | None = None) -> pd.DataFrame:
     """
     Returns a DataFrame summarizing data types and number of unique values.
 
+    Exact counts above a few thousand rarely matter for a first look, so by default counting stops once
+    a column has more than `max_unique` distinct values. Such a column is reported as `max_unique + 1`,
+    meaning "more than max_unique" rather than an exact count, and is flagged in the `capped` column.
+    Capped columns tie with each other and keep their column order in the sort.
+
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
+        max_unique (int, optional): Cap on the counted unique values. None counts all of them exactly.
+            Defaults to 1000.
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`. Built when None.
 
     Returns:
-        pd.DataFrame: Summary of dtypes and unique values.
+        pd.DataFrame: Summary of dtypes and unique values, with a boolean `capped` column that is True
+            where the count stopped at `max_unique + 1`.
     """
     # validation for a df
     validate_dataframe(df)
+    if max_unique is not None:
+        validate_positive_integer(max_unique, 'max_unique')
+
+    if ctx is None:
+        ctx = _SummaryContext(df)
+
+    if max_unique is None:
+        nunique = ctx.nunique
+        capped = np.zeros(df.shape[1], dtype=bool)
+    else:
+        nunique = np.fromiter((_bounded_nunique(col, max_unique) for _, col in df.items()), dtype=np.int64,
+                              count=df.shape[1])
+        capped = nunique > max_unique
 
     return pd.DataFrame({
-        "dtype": df.dtypes,
-        "unique_values_count": df.nunique()
-    }).sort_values(by="unique_values_count", ascending=False)
+        "dtype": ctx.dtypes.to_numpy(),
+        "unique_values_count": nunique,
+        "capped": capped
+    }, index=df.columns).sort_values(by="unique_values_count", ascending=False, kind="stable")
     
 
-def shape_summary(df: pd.DataFrame) -> dict:
+def shape_summary(df: pd.DataFrame, include_missing: bool = False, include_duplicates: bool = False,
+                  as_list: bool = False, *, ctx: _SummaryContext | None = None) -> dict:
     """
     Returns dictionary with number of rows, columns, and total values.
 
+    The default path only reads frame metadata and does not scan the data; the missing and duplicate
+    counts touch every cell or row, so they are only computed when requested.
+
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
+        include_missing (bool, optional): Add the total number of missing values. Defaults to False.
+        include_duplicates (bool, optional): Add the number of duplicated rows. Defaults to False.
+        as_list (bool, optional): Return `column_names` as a list instead of the (immutable) column Index.
+            Defaults to False.
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`; when given, its null counts and duplicate count are reused.
 
     Returns:
         dict: Basic shape info.
     """
-    return {
-        "rows": df.shape[0],
-        "columns": df.shape[1],
-        "total_size": df.size,
-        "column_names": df.columns.tolist(),
-        "missing_values_number": df.isnull().sum().sum(),
-        "duplicated_rows": df.duplicated().sum()
+    # read the metadata once, df.size would rebuild the shape tuple again
+    n_rows, n_cols = df.shape
+
+    summary = {
+        "rows": n_rows,
+        "columns": n_cols,
+        "total_size": n_rows * n_cols,
+        # the Index is already an immutable handle, a list copy is only built on request
+        "column_names": df.columns.tolist() if as_list else df.columns,
     }
 
+    if include_missing:
+        # block-wise counts, no frame-sized boolean mask
+        null_counts = _null_counts(df) if ctx is None else ctx.null_counts
+        summary["missing_values_number"] = int(null_counts.sum())
 
-def missing_summary(df: pd.DataFrame) -> pd.DataFrame:
+    if include_duplicates:
+        summary["duplicated_rows"] = _count_duplicates(df) if ctx is None else ctx.duplicated_rows
+
+    return summary
+
+
+def missing_summary(df: pd.DataFrame, engine: str = 'pandas', top_k: int | None = None,
+                    *, ctx: _SummaryContext | None = None) -> pd.DataFrame:
     """
     Returns count and percentage of missing values per column.
 
+    Only columns with at least one missing value are listed; a frame without missing values gives an
+    empty result with the same columns.
+
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
+        engine (str, optional): 'pandas' or 'polars', used to count the nulls. Defaults to 'pandas'.
+        top_k (int, optional): Keep only the `top_k` columns with the most missing values, sorted by count.
+            Defaults to None (all columns, in frame order).
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`. Built when None.
+
+    Raises:
+        TypeError: If top_k is not an integer.
+        ValueError: If engine is unknown or top_k is smaller than 1.
+        ImportError: If engine is 'polars' and polars is not installed.
 
     Returns:
         pd.DataFrame: Missing values summary.
     """
-    missing_count = df.isnull().sum()
-    missing_ratio_per_col = df.isnull().mean() * 100
-    dtype = df.dtypes
+    _check_engine(engine)
+    if top_k is not None:
+        validate_positive_integer(top_k, 'top_k')
+
+    if ctx is None:
+        ctx = _SummaryContext(df, engine)
+
+    # one null scan, the ratio is derived from the counts instead of a second isna().mean() pass
+    missing_count = ctx.null_counts
 
+    # clean columns are dropped before the ratio and dtype lookups are done
+    has_missing = missing_count.to_numpy() > 0
+    missing_count = missing_count[has_missing]
+    missing_ratio_per_col = missing_count / len(df) * 100
+
+    # plain arrays, so the frame is built positionally without aligning on column names
     result = pd.DataFrame({
-        "Column Name": df.columns,
-        "Missing Count": missing_count,
-        "Missing Ratio": missing_ratio_per_col,
-        "Data Type": dtype
-    }).reset_index(drop=True)
+        "Column Name": missing_count.index,
+        "Missing Count": missing_count.to_numpy(),
+        "Missing Ratio": missing_ratio_per_col.to_numpy(),
+        "Data Type": ctx.dtypes.to_numpy()[has_missing]
+    })
 
-    return result
+    return result if top_k is None else result.nlargest(top_k, "Missing Count").reset_index(drop=True)
 
 
-def top_values_summary(df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
+def top_values_summary(df: pd.DataFrame, top_n: int = 3, *, ctx: _SummaryContext | None = None) -> pd.DataFrame:
     """
     Returns the top `n` most frequent values for each object or categorical column.
 
@@ -241,32 +881,38 @@ def top_values_summary(df: pd.DataFrame, top_n: int = 3) -> pd.DataFrame:
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
         top_n (int, optional): Number of top values to return per column. Must be integer >= 1. Defaults to 3.
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`. Built when None.
 
     Raises:
-        TypeError: If input is not a pandas DataFrame.
-        ValueError: If top_n is not a positive integer.
+        TypeError: If input is not a pandas DataFrame, or top_n is not an integer.
+        ValueError: If top_n is smaller than 1.
 
     Returns:
         pd.DataFrame: DataFrame with columns: column, value, count, percentage.
     """
     # validators
     validate_dataframe(df)
-    validate_positive_integer(top_n)
+    validate_positive_integer(top_n, 'top_n')
+
+    n_rows = len(df)
+    cat_df = _split_by_kind(df)[1] if ctx is None else ctx.cat_df
 
-    summary = []
+    counts = []
 
-    for col in df.select_dtypes(include=["object", "category"]).columns:
-        top_vals = df[col].value_counts().head(top_n)
-        for val, count in top_vals.items():
-            pct = count / df.shape[0] * 100
-            summary.append({
-                "column": col,
-                "value": val,
-                "count": count,
-                "percentage": round(pct, 2)
-            })
+    for i, dtype in enumerate(cat_df.dtypes):
+        # categoricals are counted on their integer codes, object columns on their factorized codes
+        top = _top_categories if isinstance(dtype, pd.CategoricalDtype) else _top_objects
+        values, value_counts = top(cat_df.iloc[:, i], top_n)
+        counts.append(pd.DataFrame({"column": cat_df.columns[i], "value": values, "count": value_counts}))
 
-    return pd.DataFrame(summary).sort_values(by=["column", "count"], ascending=[True, False])
+    if not counts:
+        return pd.DataFrame(columns=["column", "value", "count", "percentage"])
+
+    summary = pd.concat(counts, ignore_index=True).sort_values(by=["column", "count"], ascending=[True, False])
+    summary["percentage"] = (summary["count"] / n_rows * 100).round(2)
+
+    return summary
 
 
 def duplicate_summary(df: pd.DataFrame) -> int:
@@ -281,64 +927,226 @@ def duplicate_summary(df: pd.DataFrame) -> int:
     """
     # validation for a df
     validate_dataframe(df)
-    
-    return df.duplicated().sum()
 
+    return _count_duplicates(df)
 
-def outlier_summary(df: pd.DataFrame, multiplier: float = 1.5) -> pd.DataFrame:
+
+def outlier_summary(df: pd.DataFrame, multiplier: float = 1.5, engine: str = 'pandas', top_k: int | None = None,
+                    use_numba: bool = False, *, ctx: _SummaryContext | None = None) -> pd.DataFrame:
     """
     Returns count of outliers per numeric column based on IQR.
 
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
         multiplier (float, optional): IQR multiplier. Defaults to 1.5.
+        engine (str, optional): 'pandas' or 'polars'. Defaults to 'pandas'.
+        top_k (int, optional): Keep only the `top_k` columns with the most outliers. Defaults to None (all).
+        use_numba (bool, optional): Count the float columns with the compiled numba kernel (engine='pandas' only).
+            Compiling the kernel, or loading it from the on-disk cache, costs more per process than it saves
+            on anything but very large frames. Defaults to False.
+        ctx (_SummaryContext, optional): Internal, keyword-only. Per-frame values shared by the sections of
+            a `SummaryReport`. Built when None.
+
+    Raises:
+        TypeError: If top_k is not an integer.
+        ValueError: If engine is unknown or top_k is smaller than 1.
+        ImportError: If engine is 'polars' and polars is not installed, or use_numba is True and numba is not.
 
     Returns:
         pd.DataFrame: Number of outliers per numeric column.
     """
-    numeric_df = df.select_dtypes(include='number')
-    outlier_counts = {}
+    _check_engine(engine)
+    if top_k is not None:
+        validate_positive_integer(top_k, 'top_k')
+    if use_numba:
+        # numba is optional and imported on first use, like polars in _check_engine
+        try:
+            from functions._numba_kernels import count_outliers_iqr
+        except ImportError:
+            logger.error("use_numba=True but numba is not installed")
+            raise ImportError("use_numba=True requires the optional numba package")
+
+    if ctx is None:
+        ctx = _SummaryContext(df, engine)
+    numeric_df = ctx.numeric_df
+
+    if engine == 'polars':
+        outlier_counts = _polars_outlier_counts(ctx.polars_numeric, multiplier)
+    else:
+        # 8/16-bit integer columns are counted from a histogram; the rest as one 2-D float array
+        is_small_int = np.array([isinstance(dtype, np.dtype) and dtype.kind in 'iu' and dtype.itemsize <= 2
+                                 for dtype in numeric_df.dtypes], dtype=bool)
+        outlier_counts = np.zeros(numeric_df.shape[1], dtype=np.int64)
+
+        for j in np.flatnonzero(is_small_int):
+            outlier_counts[j] = _histogram_outlier_count(numeric_df.iloc[:, j].to_numpy(), multiplier)
+
+        if not is_small_int.all():
+            arr = _to_float_array(numeric_df.iloc[:, np.flatnonzero(~is_small_int)])
+            if use_numba:
+                outlier_counts[~is_small_int] = count_outliers_iqr(arr, float(multiplier))
+            else:
+                outlier_counts[~is_small_int] = _numpy_outlier_counts(arr, multiplier)
+
+    result = pd.DataFrame({'outlier_count': outlier_counts}, index=numeric_df.columns).sort_values(by='outlier_count', ascending=False)
+
+    return result if top_k is None else result.head(top_k)
+
+
+class SummaryReport:
+    """
+    Lazy summary overview of a DataFrame.
 
-    for col in numeric_df.columns:
-        q1 = numeric_df[col].quantile(0.25)
-        q3 = numeric_df[col].quantile(0.75)
-        iqr = q3 - q1
-        lower = q1 - multiplier * iqr
-        upper = q3 + multiplier * iqr
-        outlier_counts[col] = ((numeric_df[col] < lower) | (numeric_df[col] > upper)).sum()
+    Every section is a cached property computed on first access, so exploring a frame only pays for
+    the sections that are looked at (the duplicate check alone can take seconds on a large frame).
+    In a notebook the report renders the sections accessed so far; `render_all()` computes and prints
+    all of them, which is what `full_summary` does.
 
-    return pd.DataFrame.from_dict(outlier_counts, orient='index', columns=['outlier_count']).sort_values(by='outlier_count', ascending=False)
+    Args:
+        df (pd.DataFrame): The DataFrame to inspect.
+        n (int, optional): Number of rows for the head section. Defaults to 5.
+        describe_mode (str, optional): 'numerical' or 'full'. Passed to describe. Defaults to 'numerical'.
+        engine (str, optional): 'pandas' or 'polars'. Passed to describe, missing_summary and outlier_summary.
+        top_k (int, optional): Number of columns kept in the missing and outliers sections. Defaults to 50.
 
+    Raises:
+        TypeError: If `df` is not a pandas DataFrame, or n or top_k is not an integer.
+        ValueError: If describe_mode or engine is unknown, or n or top_k is smaller than 1.
+        ImportError: If engine is 'polars' and polars is not installed.
+    """
 
-def full_summary(df: pd.DataFrame, n: int = 5, describe_mode: str = 'numerical') -> None:
+    # (title, attribute) in display order
+    SECTIONS = (
+        ("Head", "head"),
+        ("Info", "info"),
+        ("Descriptive Stats", "describe"),
+        ("Column Overview", "columns"),
+        ("Shape Summary", "shape"),
+        ("Missing Summary", "missing"),
+        ("Top Values Summary", "top_values"),
+        ("Duplicate Rows", "duplicates"),
+        ("Outliers Summary", "outliers"),
+    )
+
+    def __init__(self, df: pd.DataFrame, n: int = 5, describe_mode: str = 'numerical', engine: str = 'pandas',
+                 top_k: int = 50):
+        # the cheap argument checks run now rather than when the first section is accessed
+        validate_dataframe(df)
+        validate_positive_integer(n)
+        validate_positive_integer(top_k, 'top_k')
+        _check_engine(engine)
+        if describe_mode not in ('numerical', 'full'):
+            logger.error("Invalid mode: %s", describe_mode)
+            raise ValueError("mode must be either 'numerical' or 'full'")
+
+        self.df = df
+        self.n = n
+        self.describe_mode = describe_mode
+        self.engine = engine
+        self.top_k = top_k
+
+        # intermediates shared by several sections, computed once instead of once per helper
+        self._ctx = _SummaryContext(df, engine)
+
+    @cached_property
+    def head(self) -> pd.DataFrame:
+        return self.df.head(self.n)
+
+    @cached_property
+    def info(self) -> str:
+        buf = io.StringIO()
+        info(self.df, buf=buf)
+        return buf.getvalue()
+
+    @cached_property
+    def describe(self) -> pd.DataFrame:
+        return describe(self.df, mode=self.describe_mode, engine=self.engine, ctx=self._ctx)
+
+    @cached_property
+    def columns(self) -> pd.DataFrame:
+        return columns_overview(self.df, ctx=self._ctx)
+
+    @cached_property
+    def shape(self) -> dict:
+        return shape_summary(self.df, include_missing=True, include_duplicates=True, ctx=self._ctx)
+
+    @cached_property
+    def missing(self) -> pd.DataFrame:
+        return missing_summary(self.df, engine=self.engine, top_k=self.top_k, ctx=self._ctx)
+
+    @cached_property
+    def top_values(self) -> pd.DataFrame:
+        return top_values_summary(self.df, ctx=self._ctx)
+
+    @cached_property
+    def duplicates(self) -> int:
+        return self._ctx.duplicated_rows
+
+    @cached_property
+    def outliers(self) -> pd.DataFrame:
+        return outlier_summary(self.df, engine=self.engine, top_k=self.top_k, ctx=self._ctx)
+
+    def _repr_html_(self) -> str:
+        # only sections that were already computed; rendering never triggers new work
+        parts = []
+        for title, attr in self.SECTIONS:
+            if attr not in self.__dict__:
+                continue
+            result = self.__dict__[attr]
+            if isinstance(result, pd.DataFrame):
+                body = result.to_html(max_rows=50, max_cols=30)
+            else:
+                body = f"<pre>{html.escape(str(result))}</pre>"
+            parts.append(f"<h4>{title}</h4>{body}")
+
+        if not parts:
+            names = ", ".join(attr for _, attr in self.SECTIONS)
+            return f"<p>SummaryReport: no section computed yet. Access one of {names}, or call render_all().</p>"
+
+        return "".join(parts)
+
+    def render_all(self) -> None:
+        """
+        Computes every section and prints it, each displayed with at most 50 rows and 30 columns.
+
+        Returns:
+            None
+        """
+        for title, attr in self.SECTIONS:
+            print(f"\n--- {title} ---")
+            if attr == "info":
+                print(self.info, end="")
+                continue
+
+            result = getattr(self, attr)
+            if attr == "duplicates":
+                result = f"{result} duplicated rows"
+            with summary_display_context(max_rows=50, max_columns=30):
+                _display(result)
+
+
+def full_summary(df: pd.DataFrame, n: int = 5, describe_mode: str = 'numerical', engine: str = 'pandas',
+                 top_k: int = 50) -> None:
     """
     Prints a full summary overview of the DataFrame.
 
+    Every section is displayed with at most 50 rows and 30 columns, scoped to this call, so a large
+    frame does not render an unbounded HTML table. Use `SummaryReport` to compute sections on demand.
+
     Args:
         df (pd.DataFrame): The DataFrame to inspect.
         n (int, optional): Number of rows for head and tail. Defaults to 5.
         describe_mode (str, optional): 'numerical' or 'full'. Passed to get_description.
+        engine (str, optional): 'pandas' or 'polars'. Passed to describe, missing_summary and outlier_summary.
+        top_k (int, optional): Number of columns kept in the missing and outliers sections. Defaults to 50.
+
+    Raises:
+        TypeError: If `df` is not a pandas DataFrame, or n or top_k is not an integer.
+        ValueError: If describe_mode or engine is unknown, or n or top_k is smaller than 1.
+        ImportError: If engine is 'polars' and polars is not installed.
 
     Returns:
         None
     """
-    # analysis steps list
-    steps = [
-        ("Head", df.head(n)),
-        ("Info", None),  # special case
-        ("Descriptive Stats", describe(df, mode=describe_mode)),
-        ("Column Overview", columns_overview(df)),
-        ("Shape Summary", shape_summary(df)),
-        ("Missing Summary", missing_summary(df)),
-        ("Top Values Summary", top_values_summary(df)),
-        ("Duplicate Rows", f"{duplicate_summary(df)} duplicated rows"),
-        ("Outliers Summary", outlier_summary(df)),
-    ]
-
-    # steps output
-    for title, result in steps:
-        print(f"\n--- {title} ---")
-        if title == "Info":
-            df.info()
-        else:
-            display(result)
+    # arguments are checked by SummaryReport before any section is printed
+    SummaryReport(df, n=n, describe_mode=describe_mode, engine=engine, top_k=top_k).render_all()
@@ -1,10 +1,18 @@
 # module with custom validators
 # functions/validators.py
 import pandas as pd
+import numpy as np
 import logging
+import functools
+import inspect
+import operator
 
 logger = logging.getLogger(__name__)
 
+# exact types for the fast path: a `type(x) is ...` check is cheaper than an isinstance walk
+_DF_TYPE = pd.DataFrame
+_SER_TYPE = pd.Series
+
 # validators
 def validate_dataframe_or_series(obj):
     """
@@ -16,7 +24,12 @@ def validate_dataframe_or_series(obj):
     Raises:
         TypeError: If `obj` is not a DataFrame or Series.
     """
-    if not isinstance(obj, (pd.DataFrame, pd.Series)):
+    t = type(obj)
+    if t is _DF_TYPE or t is _SER_TYPE:
+        return
+
+    # subclasses still pass through isinstance
+    if not isinstance(obj, (_DF_TYPE, _SER_TYPE)):
         logger.error("Expected a pandas DataFrame or Series, got %s", type(obj))
         raise TypeError("Expected a pandas DataFrame or Series")
 
@@ -30,20 +43,84 @@ def validate_dataframe(obj):
     Raises:
         TypeError: If `obj` is not a DataFrame.
     """
-    if not isinstance(obj, pd.DataFrame):
+    if type(obj) is _DF_TYPE:
+        return
+
+    if not isinstance(obj, _DF_TYPE):
         logger.error("Expected a pandas DataFrame, got %s", type(obj))
         raise TypeError("Expected a pandas DataFrame")
 
-def validate_positive_integer(n):
+def validate_positive_integer(n, name: str = 'n'):
     """
     Validates that the input is a positive integer (>=1).
 
+    Any integer-like value is accepted (`operator.index`), including NumPy integers such as the ones
+    pandas returns from indexing; bool (and np.bool_) is rejected even though it is integer-like.
+
     Args:
         n (object): The value to validate.
+        name (str, optional): Argument name used in the error message. Defaults to 'n'.
 
     Raises:
-        ValueError: If `n` is not a positive integer.
+        TypeError: If `n` is not integer-like, or is a boolean.
+        ValueError: If `n` is smaller than 1.
     """
-    if not isinstance(n, int) or n <= 0:
-        logger.error("Invalid 'n' value: %s", n)
-        raise ValueError("n must be an integer >= 1")
+    if type(n) is int and n > 0:
+        return
+
+    if isinstance(n, (bool, np.bool_)):
+        logger.error("Invalid '%s' value: %s", name, n)
+        raise TypeError(f"{name} must be an integer, not bool")
+
+    try:
+        value = operator.index(n)
+    except TypeError:
+        logger.error("Invalid '%s' value: %s", name, n)
+        raise TypeError(f"{name} must be an integer") from None
+
+    if value <= 0:
+        logger.error("Invalid '%s' value: %s", name, n)
+        raise ValueError(f"{name} must be an integer >= 1")
+
+
+# decorator
+def validate(**validators):
+    """
+    Decorator that runs a validator on each named argument before the function body.
+
+    Parameter positions are resolved once from the signature at decoration time, so a call only
+    indexes into `args` / `kwargs`. Arguments left at their default are not validated.
+
+    Example:
+        @validate(df=validate_dataframe_or_series, n=validate_positive_integer)
+        def head(df, n=5): ...
+
+    Args:
+        **validators: Parameter name -> validator function (raising on invalid input).
+
+    Raises:
+        TypeError: At decoration time, if a name is not a parameter of the decorated function.
+    """
+    def decorator(func):
+        names = list(inspect.signature(func).parameters)
+        unknown = set(validators) - set(names)
+        if unknown:
+            logger.error("%s() has no parameters %s", func.__name__, sorted(unknown))
+            raise TypeError(f"{func.__name__}() has no parameters {sorted(unknown)}")
+
+        # (position, name, validator) in signature order, so errors surface in argument order
+        checks = tuple((i, name, validators[name]) for i, name in enumerate(names) if name in validators)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            n_args = len(args)
+            for i, name, check in checks:
+                if i < n_args:
+                    check(args[i])
+                elif name in kwargs:
+                    check(kwargs[name])
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator